@@ -1,25 +1,66 @@
+"""Activities from the Activity Endpoint."""
+
 from datetime import datetime
+from functools import lru_cache
+import time
 
 # type: ignore
 
-"""Activities from the Activity Endpoint."""
+_PRETTY_FORMAT = '%x - %X'
+
+
+def parse_utc_date(date_string: str) -> datetime:
+    """Parse an api date such as 2021-01-03T21:45:29.523+0000 into an aware datetime.
+
+    Uses datetime.fromisoformat rather than strptime. Before Python 3.11 fromisoformat only accepts offsets with a
+    colon and no trailing Z, so the offset is normalized first. It also only accepts 3 or 6 fractional digits there,
+    so other dates fall back to strptime.
+    """
+    iso_date_string = date_string
+    if iso_date_string.endswith("Z"):
+        iso_date_string = f"{iso_date_string[:-1]}+00:00"
+    elif len(iso_date_string) > 5 and iso_date_string[-5] in "+-" and iso_date_string[-3] != ":":
+        iso_date_string = f"{iso_date_string[:-2]}:{iso_date_string[-2:]}"
+    try:
+        return datetime.fromisoformat(iso_date_string)
+    except ValueError:
+        return datetime.strptime(date_string, '%Y-%m-%dT%H:%M:%S.%f%z')
+
+
+@lru_cache(maxsize=1)
+def _local_time_zone(hour: int):
+    """Return the local time zone.
+
+    Cached per hour (the hour param) so a long-running tracker still picks up DST changes.
+    """
+    return datetime.now().astimezone().tzinfo
+
+
+def local_time_zone():
+    """Return the cached local time zone."""
+    return _local_time_zone(int(time.time() // 3600))
 
 
 class Activity:
     """Activity class"""
 
+    __slots__ = ("created_date", "image_url", "type", "_pretty_date")
+
     def __init__(self, created_date, image_url, type):
         self.created_date: str = created_date
         self.image_url: str = image_url
         self.type: str = type
+        self._pretty_date: str = ""
 
     def better_date(self):
-        """Convert the date to a prettier format."""
-        my_time_zone = datetime.now().astimezone().tzinfo
-        date_and_time_of_activity_utc = datetime.strptime(self.created_date, '%Y-%m-%dT%H:%M:%S.%f%z')
-        date_and_time_of_activity_my_time_zone = date_and_time_of_activity_utc.astimezone(my_time_zone)
-        pretty_date_time = date_and_time_of_activity_my_time_zone.strftime('%x - %X')
-        return pretty_date_time
+        """Convert the date to a prettier format.
+
+        The result is stored on the first call since created_date does not change.
+        """
+        if self._pretty_date:
+            return self._pretty_date
+        self._pretty_date = parse_utc_date(self.created_date).astimezone(local_time_zone()).strftime(_PRETTY_FORMAT)
+        return self._pretty_date
     def __str__(self):
         return f"{self.better_date()} - An activity of type {self.type} created "
 
@@ -27,6 +68,8 @@ class Activity:
 class DonationActivity(Activity):
     """A donation activity"""
 
+    __slots__ = ("amount", "is_incentive", "message", "title")
+
     def __init__(self, amount, created_date, image_url, is_incentive, message, title, type):
         super().__init__(created_date, image_url, type)
         self.amount: float = amount
@@ -43,6 +86,8 @@ class DonationActivity(Activity):
 class BadgeActivity(Activity):
     """"Badge Activity"""
 
+    __slots__ = ("message", "title")
+
     def __init__(self, created_date, image_url, message, title, type):
         super().__init__(created_date, image_url, type)
         self.message: str = message
@@ -52,20 +97,30 @@ class BadgeActivity(Activity):
         return f"{self.better_date()}- {self.message}: '{self.title}' badge earned!!"
 
 
+def _build_donation_activity(json_data: dict) -> DonationActivity:
+    return DonationActivity(json_data.get('amount'), json_data.get('createdDateUTC'), json_data.get('imageURL'),
+                            json_data.get('isIncentive'), json_data.get('message'), json_data.get('title'),
+                            json_data.get('type'))
+
+
+def _build_badge_activity(json_data: dict) -> BadgeActivity:
+    return BadgeActivity(json_data.get('createdDateUTC'), json_data.get('imageURL'), json_data.get('message'),
+                         json_data.get('title'), json_data.get('type'))
+
+
+def _build_activity(json_data: dict) -> Activity:
+    return Activity(json_data.get('createdDateUTC'), json_data.get('imageURL'), json_data.get('type'))
+
+
+_ACTIVITY_BUILDERS = {"donation": _build_donation_activity,
+                      "participantBadge": _build_badge_activity,
+                      "teamBadge": _build_badge_activity}
+
+
 def create_activity(json_data: dict):
     """
     To deal with the activity endpoint, this will create activities.
+
+    Unknown activity types become a plain Activity.
     """
-    amount = json_data.get('amount')
-    created_date = json_data.get('createdDateUTC')
-    image_url = json_data.get('imageURL')
-    is_incentive = json_data.get('isIncentive')
-    message = json_data.get('message')
-    title = json_data.get('title')
-    type = json_data.get("type")
-    if type == "donation":
-        return DonationActivity(amount, created_date, image_url, is_incentive, message, title, type)
-    elif type == "participantBadge" or "teamBadge":
-        return BadgeActivity(created_date, image_url, message , title, type,)
-    else:
-        return Activity(created_date, image_url, type)
+    return _ACTIVITY_BUILDERS.get(json_data.get("type"), _build_activity)(json_data)
@@ -1,16 +1,23 @@
 """Holds all the file and internet input and output."""
 
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import takewhile
 import json
 import logging
+from operator import attrgetter
 import os
 import pathlib
 import requests
-from rich import print
-from rich.logging import RichHandler
-from typing import Tuple, Any
+from requests.adapters import HTTPAdapter
+from typing import Tuple, Any, Callable, Optional
 
 import xdgenvpy  # type: ignore
 
+try:
+    from orjson import loads as json_loads  # type: ignore
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
 from donordrivepython import api_version_suffix
 from donordrivepython.api.donation import Donation
 from donordrivepython.api.donor import Donor
@@ -21,28 +28,61 @@ from donordrivepython.api import activity # type: ignore
 el_io_log = logging.getLogger("ExtraLife IO")
 el_io_log.setLevel(logging.INFO)
 
+# Returned by get_json when the server answers 304 Not Modified to a request made with the caller's validators.
+NOT_MODIFIED = object()
+# The ETag/Last-Modified validators and decoded JSON of the last successful response, keyed by full URL.
+_response_cache: dict[str, Tuple[dict[str, str], Any]] = {}
+# The most api requests made at the same time by the updates run with run_concurrently.
+MAX_CONCURRENT_REQUESTS = 16
+# Shared by every Participant and Team so recreating them doesn't leave idle threads behind.
+_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="donordrive")
+# One session for all api requests so the connection to the server is kept alive and reused.
+# It already asks for gzip/deflate encoded responses. The pool has room for the shared executor's requests plus the
+# ones made directly by the threads waiting on it (e.g. the teams in team_groups.run_all).
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=2 * MAX_CONCURRENT_REQUESTS))
+_session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=2 * MAX_CONCURRENT_REQUESTS))
+REQUEST_TIMEOUT = 10  # seconds
+
 
 def validate_url(url: str):
     el_io_log.debug(f"[bold blue]Checking: {url}[/bold blue]")
-    response = requests.get(url)
+    response = _session.get(url, timeout=REQUEST_TIMEOUT)
     el_io_log.debug(f"[bold magenta]Response is: {response.status_code}[/bold magenta]")
     return response.status_code == 200
 
 
 # JSON/URL
-def get_json(url: str, order_by_donations: bool = False, order_by_amount: bool = False) -> dict:
+def _get_validators(response: requests.Response) -> dict[str, str]:
+    """Turn the ETag and Last-Modified headers of a response into the headers for a conditional request."""
+    validators = {}
+    if etag := response.headers.get('ETag'):
+        validators['If-None-Match'] = etag
+    if last_modified := response.headers.get('Last-Modified'):
+        validators['If-Modified-Since'] = last_modified
+    return validators
+
+
+def get_json(url: str, order_by_donations: bool = False, order_by_amount: bool = False,
+             validators: Optional[dict[str, str]] = None) -> dict:
     """Grab JSON from server.
 
     Connects to server and grabs JSON data from the specified URL. The api server should return JSON with the donation \
     data.
 
+    If an earlier response for the URL had an ETag or Last-Modified header, the request is made conditional. When the \
+    server answers 304 Not Modified, the JSON from that earlier response is returned without being decoded again.
+
     :param url: api URL for the specific json api point.
     :param order_by_donations: If true, the url param has data appended that will cause the api to return the\
     data in descending order of the sum of donations.
     :param order_by_amount: If true, the url param has data appended that will cause the api to return the\
     data in descending order of the sum of amounts.
+    :param validators: The caller's own validators from the last response it processed for this URL. When given, \
+    they are used instead of the shared cache: the request is only conditional if they aren't empty, NOT_MODIFIED is \
+    returned on a 304, and they are replaced with the new response's validators on a 200.
 
-    :return: JSON as dictionary with api data.
+    :return: JSON as dictionary with api data, or NOT_MODIFIED.
 
     :raises: ConnectionError, Timeout
     """
@@ -54,10 +94,26 @@ def get_json(url: str, order_by_donations: bool = False, order_by_amount: bool =
         url += f"?orderBy=amount%20DESC&{api_version_suffix}"
     else:
         url += f"?{api_version_suffix}"
+    cached = _response_cache.get(url) if validators is None else None
+    if cached:
+        header.update(cached[0])
+    elif validators:
+        header.update(validators)
     try:
         el_io_log.debug(url)
-        response = requests.get(url=url, headers=header)
-        return response.json()  # type: ignore
+        response = _session.get(url=url, headers=header, timeout=REQUEST_TIMEOUT)
+        if validators and response.status_code == 304:
+            return NOT_MODIFIED  # type: ignore
+        if cached and response.status_code == 304:
+            return cached[1]
+        json_response = json_loads(response.content)
+        if response.status_code == 200:
+            if validators is not None:
+                validators.clear()
+                validators.update(_get_validators(response))
+            elif response_validators := _get_validators(response):
+                _response_cache[url] = (response_validators, json_response)
+        return json_response  # type: ignore
     except requests.exceptions.ConnectionError as this_error:  # pragma: no cover
         el_io_log.error(f"""[bold red]Could not get to {url}.
                 Exact error was: {this_error}.
@@ -67,8 +123,8 @@ def get_json(url: str, order_by_donations: bool = False, order_by_amount: bool =
                 https://github.com/djotaku/ELDonationTracker[/bold red]""")
         return {}
     except requests.exceptions.Timeout:  # pragma: no cover
-        el_io_log.error(f"[bold red]HTTP code: {response.status_code}[/bold red]")  # type: ignore
-        el_io_log.error("[bold red]Timed out while getting JSON. [/bold red]")
+        el_io_log.error(f"[bold red]Timed out after {REQUEST_TIMEOUT} seconds while getting JSON from "
+                        f"{url}.[/bold red]")
         return {}
     except json.decoder.JSONDecodeError:  # pragma: no cover
         el_io_log.error("[bold red]Error with JSON response. [/bold red]")
@@ -77,10 +133,32 @@ def get_json(url: str, order_by_donations: bool = False, order_by_amount: bool =
         return {}
 
 
+# Key function for ordering donations, donors, or team participants by amount.
+by_amount = attrgetter('amount')
+
+
+def run_concurrently(*updates: Callable[[], None], executor: Optional[Executor] = None) -> None:
+    """Run independent update methods on an executor and wait for all of them to finish.
+
+    Used to overlap the api requests made by each update. Exceptions raised by an update are re-raised here.
+
+    The updates run on the shared executor must not call run_concurrently themselves, or they could end up waiting \
+    on work queued behind them.
+
+    :param updates: Callables that take no arguments, e.g. bound update methods.
+    :param executor: The executor to run the updates on. Defaults to the shared executor.
+    """
+    executor = executor or _executor
+    for future in [executor.submit(update) for update in updates]:
+        future.result()
+
+
 def get_donations(donations_or_donors: list, api_url: str, is_donation=True, largest_first=False) -> list:
     """Get the donations from the JSON and create the donation objects.
 
     If the api can't be reached, the same list is returned. Only new donations are added to the list at the end.
+    For donations these are the ones the api lists before the newest donation already in the list, so donations \
+    trimmed off the end of the list aren't added back.
 
     :param is_donation: True if we are getting data for donations. False if we are getting data for donors.
     :param largest_first: True if we want to sort by largest. False if sort by latest donors or donations.
@@ -95,6 +173,12 @@ def get_donations(donations_or_donors: list, api_url: str, is_donation=True, lar
     if not json_response:
         el_io_log.error(f"[bold red]Couldn't access JSON endpoint at {api_url}.[/bold red]")
         return donations_or_donors
+    elif is_donation and donations_or_donors:  # only create Donation objects for the donations we don't have yet
+        known_donation_ids = {a_donation.donation_id for a_donation in donations_or_donors}
+        donations_or_donors[0:0] = [Donation(this_donation) for this_donation in
+                                    takewhile(lambda a_donation: a_donation.get('donationID') not in known_donation_ids,
+                                              json_response)]
+        return donations_or_donors
     else:
         if is_donation:
             donor_or_donation_list = [Donation(this_donation) for this_donation in json_response]
@@ -109,20 +193,33 @@ def get_donations(donations_or_donors: list, api_url: str, is_donation=True, lar
             return donations_or_donors
 
 
-def get_badges(api_url: str) -> list[Badge]:
+def get_badges(api_url: str, known_badges: Optional[dict[str, Badge]] = None) -> list[Badge]:
     """Get badges from the api endpoint and create a list to return.
 
     :param api_url: The URL for the api endpoint.
+    :param known_badges: Badges created on earlier calls, by badge code. These are reused instead of being created\
+    again and any new badges are added to it. Badges without a badge code are always created.
     :returns: A list of badges.
     """
     json_response = get_json(api_url)
-    return [Badge.create_badge(badge_item) for badge_item in json_response]
+    if known_badges is None:
+        return list(map(Badge.create_badge, json_response))
+    badges = []
+    for badge_item in json_response:
+        badge_code = badge_item.get("badgeCode")
+        if badge_code is None:
+            badges.append(Badge.create_badge(badge_item))
+            continue
+        if badge_code not in known_badges:
+            known_badges[badge_code] = Badge.create_badge(badge_item)
+        badges.append(known_badges[badge_code])
+    return badges
 
 
 def get_activities(api_url: str) -> list[activity.Activity]:
     """Get activities from the api endpiont and create a list to return."""
     json_response = get_json(api_url)
-    return [activity.create_activity(activity_item) for activity_item in json_response]
+    return list(map(activity.create_activity, json_response))
 
 # File Input and Output
 # input
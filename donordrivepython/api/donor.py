@@ -9,6 +9,8 @@ class Donor:
     needs to be taken.
     """
 
+    __slots__ = ("_name", "_donor_id", "_image_url", "_amount", "_number_of_donations")
+
     def __init__(self, json):
         """Load in values from class initialization.
 
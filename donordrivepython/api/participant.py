@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 import logging
 from rich import print  # type ignore
 from rich.logging import RichHandler  # type ignore
+import sys
 import time
 
 from donordrivepython.api import donor, team, donation, badge, activity
@@ -36,6 +37,7 @@ class Participant:
         self._donation_url: str = ""
         self._participant_donor_url: str = ""
         self._my_team: team.Team = None
+        self._currency_format = None
 
         # Participant Information
         self._total_raised: int = 0
@@ -60,7 +62,6 @@ class Participant:
 
         # donation information
         self._donation_list: list[donation] = []
-        self._ordered_donation_list: list[donation] = []
         self._top_donation = None
         self._top_donation_formatted_output: dict = {'TopDonationNameAmnt': "No Donations Yet "}
         self._donation_formatted_output: dict = {'LastDonationNameAmnt': "No Donations Yet ",
@@ -72,7 +73,6 @@ class Participant:
         self._top_donor = None
         self._top_donor_formatted_output: dict = {'TopDonorNameAmnt': "No Donors Yet "}
         self._donor_list: list[donor] = []
-        self._ordered_donor_list: list[donor] = []
         self._donor_formatted_output: dict = {'LastDonorNameAmnt': "No Donations Yet ",
                                               'lastNDonorNameAmts': "No Donations Yet ",
                                               'lastNDonorNameAmtsMessage': "No Donations Yet ",
@@ -82,12 +82,16 @@ class Participant:
         # other api endpoints
         self._badge_url: str = ''
         self._badges: list[badge.Badge] = []
+        self._badges_by_code: dict[str, badge.Badge] = {}
         self._milestone_url: str = ''
         self._milestones: list[Milestone] = []
+        self._milestone_validators: dict[str, str] = {}
         self._incentive_url: str = ''
         self._incentives: list[Incentive] = []
+        self._incentive_validators: dict[str, str] = {}
         self._activity_url: str = ''
         self._activities: list[activity.Activity] = []
+        self._activity_validators: dict[str, str] = {}
 
         # misc
         self._first_run: bool = True
@@ -276,35 +280,42 @@ class Participant:
         self._milestone_url = f"{self.participant_url}/milestones"
         self._incentive_url = f"{self.participant_url}/incentives"
         self._activity_url = f"{self.participant_url}/activity"
+        # formatting
+        currency_symbol = self.currency_symbol or ""
+        self._currency_format = (currency_symbol.replace("{", "{{").replace("}", "}}") + "{:,.2f}").format
 
         if self.team_id:
             self._my_team = team.Team(self.team_id, self.text_folder, self.currency_symbol, self.donors_to_display,
                                       self._base_api_url)
 
-    def _get_participant_info(self):
-        """Get JSON data for participant information.
+    def _get_participant_info(self) -> None:
+        """Get JSON data for participant information and store it in the participant attributes.
 
-        :returns: JSON data for self.total_raised, self.number_of_donations, and self.goal.
+        If the api can't be reached, the attributes keep their current values.
         """
         participant_json = donor_drive_comms.get_json(self.participant_url)
         if not participant_json:
             participant_log.warning("[bold red]Couldn't access participant JSON.[/bold red]")
-            return self.total_raised, self.number_of_donations, self.goal, self.avatar_image_url, self.event_name, \
-                self.donation_link_url, self.stream_url, self.extra_life_page_url, self.created_date_utc,\
-                self.stream_is_live, self.sum_pledges, self.team_name, self.is_team_captain, self.display_name
+            return
+        links = participant_json.get('links') or {}
+        self._total_raised = participant_json.get('sumDonations')
+        self._number_of_donations = participant_json.get('numDonations')
+        self._goal = participant_json.get('fundraisingGoal')
+        self._avatar_image_url = participant_json.get('avatarImageURL')
+        self._event_name = participant_json.get('eventName')
+        self._donation_link_url = links.get("donate")
+        self._stream_url = links.get('stream')
+        self._extra_life_page_url = links.get('page')
+        self._created_date_utc = participant_json.get('createdDateUTC')
+        self._stream_is_live = participant_json.get("streamIsLive")
+        self._sum_pledges = participant_json.get('sumPledges')
+        if self.my_team:
+            self._team_name = participant_json.get('teamName')
+            self._is_team_captain = participant_json.get('isTeamCaptain')
         else:
-            if self.my_team:
-                team_name = participant_json.get('teamName')
-                is_team_captain = participant_json.get('isTeamCaptain')
-            else:
-                team_name = ''
-                is_team_captain = False
-            return participant_json.get('sumDonations'), participant_json.get('numDonations'), \
-                participant_json.get('fundraisingGoal'), participant_json.get('avatarImageURL'), \
-                participant_json.get('eventName'), participant_json.get('links').get("donate"), \
-                participant_json.get('links').get('stream'), participant_json.get('links').get('page'), \
-                participant_json.get('createdDateUTC'), participant_json.get("streamIsLive"), \
-                participant_json.get('sumPledges'), team_name, is_team_captain, participant_json.get('displayName')
+            self._team_name = ''
+            self._is_team_captain = False
+        self._display_name = participant_json.get('displayName')
 
     def _format_participant_info_for_output(self, participant_attribute) -> str:
         """Format participant info for output to text files.
@@ -312,16 +323,15 @@ class Participant:
         :param participant_attribute: the data to be formatted for the output.
         :returns: A string with the formatted information.
         """
-        return f"{self.currency_symbol}{participant_attribute:,.2f}"
+        return self._currency_format(participant_attribute)
 
     def _fill_participant_dictionary(self) -> None:
         """Fill up self.participant_formatted_output ."""
-        self._participant_formatted_output["totalRaised"] = \
-            self._format_participant_info_for_output(self.total_raised)
-        self._participant_formatted_output["averageDonation"] = \
-            self._format_participant_info_for_output(self.average_donation)
-        self._participant_formatted_output["goal"] = self._format_participant_info_for_output(self.goal)
-        self._participant_formatted_output["numDonations"] = str(self.number_of_donations)
+        currency_format = self._currency_format
+        self._participant_formatted_output = {"totalRaised": currency_format(self.total_raised),
+                                              "averageDonation": currency_format(self.average_donation),
+                                              "goal": currency_format(self.goal),
+                                              "numDonations": str(self.number_of_donations)}
 
     def _calculate_average_donation(self):
         """Calculate the average donation amount.
@@ -337,18 +347,22 @@ class Participant:
         """Return top donations from server.
 
         Uses donor drive's sorting to get the top donation."""
-        return donor_drive_comms.get_donations(self._ordered_donation_list, self.donation_url, True, True)
+        return donor_drive_comms.get_donations([], self.donation_url, True, True)
 
     def _get_top_donors(self):  # pragma: no cover
         """Return Top Donors from server.
 
         Uses donor drive's sorting to get the top guy or gal.
         """
-        return donor_drive_comms.get_donations(self._ordered_donor_list, self.participant_donor_url, False, True)
+        return donor_drive_comms.get_donations([], self.participant_donor_url, False, True)
 
     def _get_donors(self):  # pragma: no cover
-        """Return Donors from server."""
-        return donor_drive_comms.get_donations(self._ordered_donor_list, self.participant_donor_url, False, False)
+        """Return Donors from server.
+
+        Each donor's totals come from the api, so the latest donors replace the list instead of being merged into it.
+        If the api can't be reached, the current list is returned.
+        """
+        return donor_drive_comms.get_donations([], self.participant_donor_url, False, False) or self._donor_list
 
     def _format_donor_information_for_output(self) -> None:
         """Format the donor attributes for the output files."""
@@ -372,57 +386,82 @@ class Participant:
 
          Also called from the main loop.
          """
-        self._total_raised, self._number_of_donations, self._goal, self._avatar_image_url, \
-            self._event_name, self._donation_link_url, self._stream_url, \
-            self._extra_life_page_url, self._created_date_utc, self._stream_is_live, \
-            self._sum_pledges, self._team_name, self._is_team_captain, self._display_name = self._get_participant_info()
+        self._get_participant_info()
         self._average_donation = self._calculate_average_donation()
 
+    def _donations_to_keep(self) -> int:
+        """Only this many of the latest donations (and donors) are kept; extra headroom over what is displayed."""
+        return max(int(self.donors_to_display) * 4, 50)
+
     def update_donation_data(self) -> None:
         """Update donation data."""
         if self.number_of_donations > 0:
             self._donation_list = donor_drive_comms.get_donations(self._donation_list, self.donation_url)
-            self._ordered_donation_list = self._get_top_donations()
-            try:
-                self._top_donation = self._ordered_donation_list[0]
-            except IndexError:  # pragma: no cover
-                pass
+            if self._top_donation is None:
+                # the api's ordering covers every donation, not just the newest ones we fetch
+                top_donations = self._get_top_donations()
+                if top_donations:
+                    self._top_donation = top_donations[0]
+            # after that, keep a running top donation from the new donations
+            if self._donation_list:
+                largest_donation = max(self._donation_list, key=donor_drive_comms.by_amount)
+                if self._top_donation is None or largest_donation.amount > self._top_donation.amount:
+                    self._top_donation = largest_donation
+            del self._donation_list[self._donations_to_keep():]
 
     def update_donor_data(self) -> None:
         """Update donor data."""
         if self.number_of_donations > 0:
             self._donor_list = self._get_donors()
+            if self._top_donor is None:
+                # the api's ordering covers every donor, not just the newest ones we fetch
+                top_donors = self._get_top_donors()
+                if top_donors:
+                    self._top_donor = top_donors[0]
             # anonymous donors mess things up because they don't populate the donor api endpoint.
             # So this check prevents a crash.
             if self._donor_list:
-                self._ordered_donor_list = self._get_top_donors()
-                self._top_donor = self._ordered_donor_list[0]
+                largest_donor = max(self._donor_list, key=donor_drive_comms.by_amount)
+                if self._top_donor is None or largest_donor.amount >= self._top_donor.amount:
+                    self._top_donor = largest_donor
+                del self._donor_list[self._donations_to_keep():]
 
     def _update_badges(self) -> None:
         """Add all our badges to the list."""
-        self._badges = donor_drive_comms.get_badges(self.badge_url)
+        self._badges = donor_drive_comms.get_badges(self.badge_url, self._badges_by_code)
 
     def _update_milestones(self) -> None:
         """Add all milestones to the list"""
-        json_response = donor_drive_comms.get_json(self.milestone_url)
-        self._milestones = [Milestone.create_milestone(milestone_item) for milestone_item in json_response]
+        validators = dict(self._milestone_validators)
+        json_response = donor_drive_comms.get_json(self.milestone_url, validators=validators)
+        if json_response is donor_drive_comms.NOT_MODIFIED:
+            return
+        self._milestones = list(map(Milestone.create_milestone, json_response))
+        self._milestone_validators = validators
 
     def _update_incentives(self) -> None:
         """Add all incentives to list"""
-        json_response = donor_drive_comms.get_json(self.incentive_url)
-        self._incentives = [Incentive.create_incentive(incentive) for incentive in json_response]
+        validators = dict(self._incentive_validators)
+        json_response = donor_drive_comms.get_json(self.incentive_url, validators=validators)
+        if json_response is donor_drive_comms.NOT_MODIFIED:
+            return
+        self._incentives = list(map(Incentive.create_incentive, json_response))
+        self._incentive_validators = validators
 
     def _update_activities(self) -> None:
         """Add Participant Activities to list"""
-        json_response = donor_drive_comms.get_json(self._activity_url)
-        self._activities = [activity.create_activity(item) for item in json_response]
+        validators = dict(self._activity_validators)
+        json_response = donor_drive_comms.get_json(self._activity_url, validators=validators)
+        if json_response is donor_drive_comms.NOT_MODIFIED:
+            return
+        self._activities = list(map(activity.create_activity, json_response))
+        self._activity_validators = validators
 
     def run(self) -> None:
         """Run to get participant, donation, donor, and team data and output to text files."""
         number_of_donations = self.number_of_donations
-        self.update_participant_attributes()
-        self._update_incentives()
-        self._update_activities()
+        donor_drive_comms.run_concurrently(self.update_participant_attributes, self._update_incentives,
+                                           self._update_activities)
         # Below is protection against a situation where the api is unavailable.
         # Prevents bad data being written to the participant output. Based on the assumption that it would
         # absurd to have a goal of $0.
@@ -430,10 +469,8 @@ class Participant:
             if not self._first_run:
                 print("[bold green]A new donation![/bold green]")
                 self._new_donation = True
-            self.update_donation_data()
-            self.update_donor_data()
-            self._update_badges()
-            self._update_milestones()
+            donor_drive_comms.run_concurrently(self.update_donation_data, self.update_donor_data, self._update_badges,
+                                               self._update_milestones)
         # TEAM BLOCK ############################################
         if self.team_id:
             self.my_team.team_run()
@@ -448,7 +485,7 @@ class Participant:
             return f"A participant with Extra Life ID {self.donor_drive_id}."
 
 
-@dataclass
+@dataclass(slots=True)
 class Milestone:  # type: ignore
     """Fundraiser milestones associated with a Participant.
 
@@ -468,21 +505,18 @@ class Milestone:  # type: ignore
     @staticmethod
     def create_milestone(json_data: dict):    # type: ignore
         """Uses the provided JSON data to create a Milestone object."""
-        # let's start with the data guaranteed to be returned
-        description = json_data.get("description")
-        fundraising_goal = json_data.get('fundraisingGoal')
-        is_active = json_data.get('isActive')
-        milestone_id = json_data.get('milestoneID')
-        # now the ones that may not be there
-        is_complete = json_data.get('isComplete', False)
-        links = json_data.get('links', {})
-        end_date_utc = json_data.get('endDateUTC', '')
-        start_date_utc = json_data.get('startDateUTC', '')
-        return Milestone(description, fundraising_goal, is_active, milestone_id, is_complete, links,  # type: ignore
-                         end_date_utc, start_date_utc)  # type: ignore
-
-
-@dataclass
+        return Milestone(description=json_data.get("description"),  # type: ignore
+                         fundraising_goal=json_data.get('fundraisingGoal'),
+                         is_active=json_data.get('isActive'),
+                         milestone_id=json_data.get('milestoneID'),
+                         # now the ones that may not be there
+                         is_complete=json_data.get('isComplete', False),
+                         links=json_data.get('links', {}),
+                         end_date_utc=json_data.get('endDateUTC', ''),
+                         start_date_utc=json_data.get('startDateUTC', ''))
+
+
+@dataclass(slots=True)
 class Incentive:  # type: ignore
     """Fundraiser incentives associated with a Participant.
 
@@ -504,20 +538,17 @@ class Incentive:  # type: ignore
     @staticmethod
     def create_incentive(json_data: dict):
         """Uses the provided JSON data to create an Incentive object."""
-        # guaranteed data from the api endpoint
-        amount = json_data.get("amount")
-        description = json_data.get("description")
-        incentive_id = json_data.get('incentiveID')
-        is_active = json_data.get("isActive")
-        # optional data
-        end_data_utc = json_data.get("endDateUTC", '')
-        incentive_image_url = json_data.get("incentiveImageURL", '')
-        links = json_data.get("links", {})
-        start_date_utc = json_data.get("startDateUTC", '')
-        quantity = json_data.get("quantity", 0)
-        quantity_claimed = json_data.get("quantityClaimed", 0)
-        return Incentive(amount, description, incentive_id, is_active, end_data_utc,  # type: ignore
-                         incentive_image_url, links, start_date_utc, quantity, quantity_claimed)  # type: ignore
+        return Incentive(amount=json_data.get("amount"),  # type: ignore
+                         description=json_data.get("description"),
+                         incentive_id=json_data.get('incentiveID'),
+                         is_active=json_data.get("isActive"),
+                         # optional data
+                         end_date_utc=json_data.get("endDateUTC", ''),
+                         incentive_image_url=json_data.get("incentiveImageURL", ''),
+                         links=json_data.get("links", {}),
+                         start_date_utc=json_data.get("startDateUTC", ''),
+                         quantity=json_data.get("quantity", 0),
+                         quantity_claimed=json_data.get("quantityClaimed", 0))
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -529,6 +560,6 @@ if __name__ == "__main__":  # pragma: no cover
     print(p)
     while True:
         p.run()
-        for an_activity in p.activities:
-            print(f"{an_activity}\n")
+        if p.activities:
+            sys.stdout.write("\n\n".join(map(str, p.activities)) + "\n\n")
         time.sleep(15)
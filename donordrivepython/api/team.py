@@ -1,7 +1,7 @@
 """Contains classes pertaining to teams."""
+from functools import lru_cache
+import heapq
 import logging
-from rich import print
-from rich.logging import RichHandler
 from typing import Tuple, List
 
 from donordrivepython.api import comms as donor_drive_comms
@@ -14,9 +14,34 @@ team_log = logging.getLogger("Team:")
 team_log.setLevel(logging.INFO)
 
 
+@lru_cache(maxsize=512)
+def _format_money(currency_symbol: str, amount: float) -> str:
+    """Format an amount of money for the output text files.
+
+    Cached since the team totals are usually the same from one poll to the next.
+    """
+    return f"{currency_symbol}{amount:,.2f}"
+
+
 class Team:
     """Hold Team api Data."""
 
+    __slots__ = ("_team_id", "_team_url_base", "team_url", "team_participant_url", "team_donation_url",
+                 "_output_folder", "currency_symbol", "donors_to_display",
+                 "_team_info", "_team_json_validators", "_last_team_snapshot",
+                 "_team_goal", "_team_captain", "_total_raised", "_num_donations", "team_avatar_image",
+                 "_participant_calculation_dict", "_top_5_participant_list", "_participant_list",
+                 "_last_top_participant", "_last_top_participant_text",
+                 "_donation_list", "_donation_formatted_output", "_last_donation_fingerprint",
+                 "badge_url", "_badges", "_badges_by_code", "activity_url", "_activity_list")
+
+    # donation output until the team has donations; copied into each instance
+    _DEFAULT_DONATION_OUTPUT: dict = {'Team_LastDonationNameAmnt': "No Donations Yet",
+                                      'Team_lastNDonationNameAmts': "No Donations Yet",
+                                      'Team_lastNDonationNameAmtsMessage': "No Donations Yet",
+                                      'Team_lastNDonationNameAmtsMessageHorizontal': "No Donations Yet",
+                                      'Team_lastNDonationNameAmtsHorizontal': "No Donations Yet"}
+
     def __init__(self, team_id: str, output_folder: str, currency_symbol: str, donors_to_display: str,
                  base_api_url: str):
         """Set the team variables.
@@ -33,35 +58,37 @@ class Team:
         self._team_id: str = team_id
         # urls
         self._team_url_base: str = f"{base_api_url}/teams/"
-        self._team_url: str = f"{self.team_url_base}{team_id}"
-        self._team_participant_url: str = f"{self.team_url}/participants"
-        self._team_donation_url: str = f"{self.team_url}/donations"
+        self.team_url: str = f"{self.team_url_base}{team_id}"  # URL to the team JSON api
+        self.team_participant_url: str = f"{self.team_url}/participants"
+        self.team_donation_url: str = f"{self.team_url}/donations"
         # misc
         self._output_folder: str = output_folder
-        self._currency_symbol: str = currency_symbol
-        self._donors_to_display: str = donors_to_display
+        self.currency_symbol: str = currency_symbol  # the currency symbol used in the output
+        self.donors_to_display: str = donors_to_display  # the number of donors to write out to the output file
         # team info
         self._team_info: dict = {}  # a dictionary to values for output to text files
+        self._team_json_validators: dict[str, str] = {}  # ETag/Last-Modified of the last team JSON this team read
+        self._last_team_snapshot: tuple = ()  # the values _team_info was last filled with
         self._team_goal: int = 0
         self._team_captain: str = ""
         self._total_raised: int = 0
         self._num_donations: int = 0
-        self._team_avatar_image: str = ''
+        self.team_avatar_image: str = ''  # the team's avatar image
         # donor info
         self._participant_calculation_dict: dict = {}  # dictionary holding output for txt files
         self._top_5_participant_list: List[TeamParticipant] = []  # list: top 5 team participants by amount donated.
         self._participant_list: List[TeamParticipant] = []  # A list of the most recent participants
+        self._last_top_participant: tuple = ()  # (name, amount) of the top participant last formatted
+        self._last_top_participant_text: str = ""
         # donation info
         self._donation_list: List[donation.Donation] = []
-        self._donation_formatted_output: dict = {'Team_LastDonationNameAmnt': "No Donations Yet",
-                                                 'Team_lastNDonationNameAmts': "No Donations Yet",
-                                                 'Team_lastNDonationNameAmtsMessage': "No Donations Yet",
-                                                 'Team_lastNDonationNameAmtsMessageHorizontal': "No Donations Yet",
-                                                 'Team_lastNDonationNameAmtsHorizontal': "No Donations Yet"}
+        self._donation_formatted_output: dict = Team._DEFAULT_DONATION_OUTPUT.copy()
+        self._last_donation_fingerprint: tuple = ()  # (number of donations, newest donation ID) last formatted
         # other api endpoints
-        self._badge_url: str = f"{self.team_url}/badges"
+        self.badge_url: str = f"{self.team_url}/badges"  # the team's badge URL
         self._badges: list[Badge] = []
-        self._activity_url: str = f"{self.team_url}/activity"
+        self._badges_by_code: dict[str, Badge] = {}
+        self.activity_url: str = f"{self.team_url}/activity"
         self._activity_list: list[activity.Activity] = []
 
     @property
@@ -74,36 +101,11 @@ class Team:
         """The donor drive endpoint for the teams."""
         return self._team_url_base
 
-    @property
-    def team_url(self) -> str:
-        """URL to the team JSON api."""
-        return self._team_url
-
-    @property
-    def team_participant_url(self) -> str:
-        """URL to the JSON api for participants in the team."""
-        return self._team_participant_url
-
-    @property
-    def team_donation_url(self) -> str:
-        """URL to the JSON api for donations to the team."""
-        return self._team_donation_url
-
     @property
     def output_folder(self) -> str:
         """The folder for the output text files."""
         return self._output_folder
 
-    @property
-    def currency_symbol(self) -> str:
-        """The currency symbol used in the output."""
-        return self._currency_symbol
-
-    @property
-    def donors_to_display(self) -> str:
-        """The number of donors to write out to the output file."""
-        return self._donors_to_display
-
     @property
     def team_goal(self) -> int:
         """The fundraising goal of the team."""
@@ -124,19 +126,6 @@ class Team:
         """The number of donations to the team."""
         return self._num_donations
 
-    @property
-    def team_avatar_image(self) -> str:
-        """The team's avatar image."""
-        if self._team_avatar_image:
-            return self._team_avatar_image
-        else:
-            return ""
-
-    @property
-    def badge_url(self) -> str:
-        """Return the team's badge URL"""
-        return self._badge_url
-
     @property
     def badges(self) -> list[Badge]:
         """Return the list of Team's badges."""
@@ -150,49 +139,63 @@ class Team:
     def _get_team_json(self) -> Tuple:
         """Get team info from JSON api.
 
-        :returns: JSON values for fundraising goal, Captain's name, total value of donations, and the # of donations.
+        :returns: JSON values for fundraising goal, Captain's name, total value of donations, the # of donations, and\
+        the avatar image. The last value is True if the team JSON changed since this team's previous request.
         """
-        team_json = donor_drive_comms.get_json(self.team_url)
+        validators = dict(self._team_json_validators)
+        team_json = donor_drive_comms.get_json(self.team_url, validators=validators)
+        if team_json is donor_drive_comms.NOT_MODIFIED:
+            return self.team_goal, self.team_captain, self.total_raised, self.num_donations, self.team_avatar_image, \
+                False
         if team_json:
+            self._team_json_validators = validators
             return team_json.get("fundraisingGoal"), team_json.get("captainDisplayName"), \
-                   team_json.get("sumDonations"), team_json.get("numDonations"), team_json.get("avatarImageURL")
-        team_log.warning("[bold magenta]Could not get team JSON[/bold magenta]")
-        return self.team_goal, self.team_captain, self.total_raised, self.num_donations, self.team_avatar_image
+                   team_json.get("sumDonations"), team_json.get("numDonations"), \
+                   team_json.get("avatarImageURL") or "", True
+        team_log.warning("Could not get team JSON from %s", self.team_url)
+        return self.team_goal, self.team_captain, self.total_raised, self.num_donations, self.team_avatar_image, False
 
     def _update_team_dictionary(self) -> None:
-        self._team_info["Team_goal"] = f"{self.currency_symbol}{self.team_goal:,.2f}"
+        """Fill up self._team_info, unless the team values and currency symbol are the same as last time."""
+        team_snapshot = (self.team_goal, self.team_captain, self.total_raised, self.num_donations,
+                         self.currency_symbol)
+        if team_snapshot == self._last_team_snapshot:
+            return
+        self._last_team_snapshot = team_snapshot
+        self._team_info["Team_goal"] = _format_money(self.currency_symbol, self.team_goal)
         self._team_info["Team_captain"] = f"{self.team_captain}"
-        self._team_info["Team_totalRaised"] = f"{self.currency_symbol}{self.total_raised:,.2f}"
+        self._team_info["Team_totalRaised"] = _format_money(self.currency_symbol, self.total_raised)
         self._team_info["Team_numDonations"] = f"{self.num_donations}"
 
-    def _get_participants(self, top5: bool) -> List[TeamParticipant]:
+    def _get_participants(self) -> List[TeamParticipant]:
         """Get team participant info from api.
 
         Passes the JSON to the TeamParticipant class for parsing to create a team participant.
 
-        :param top5: If true, get the list sorted by top sum of donations.
         :returns: A list of TeamParticipant objects.
         """
-        team_participant_json = donor_drive_comms.get_json(self.team_participant_url, top5)
+        team_participant_json = donor_drive_comms.get_json(self.team_participant_url)
         if team_participant_json:
-            return [TeamParticipant(participant) for participant in team_participant_json]
-        team_log.warning("[bold magenta]Couldn't get to URL or possibly no participants.[/bold magenta]")
-        if top5:
-            return self._top_5_participant_list
-        else:
-            return self._participant_list
+            return list(map(TeamParticipant, team_participant_json))
+        team_log.warning("Couldn't get to %s or possibly no participants.", self.team_participant_url)
+        return self._participant_list
 
     def _top_participant(self) -> str:
         """Get Top Team Participant.
 
-        This should just grab element 0 from self.top_5_participant_list instead of hitting api twice
+        This should just grab element 0 from self.top_5_participant_list instead of hitting api twice.
+        The string is only formatted again if the top participant's name or amount changed.
 
         :returns: String formatted information about the top participant.
         """
-        if len(self._top_5_participant_list) != 0:
-            return (f"{self._top_5_participant_list[0].name} - $"
-                    f"{self._top_5_participant_list[0].amount:,.2f}")
-        team_log.info("[bold blue] No participants[/bold blue] ")
+        if self._top_5_participant_list:
+            top_participant = self._top_5_participant_list[0]
+            top_participant_key = (top_participant.name, top_participant.amount)
+            if top_participant_key != self._last_top_participant:
+                self._last_top_participant = top_participant_key
+                self._last_top_participant_text = f"{top_participant.name} - ${top_participant.amount:,.2f}"
+            return self._last_top_participant_text
+        team_log.info("No participants")
         return "No participants."
 
     def _participant_calculations(self) -> None:
@@ -204,41 +207,51 @@ class Team:
 
     def _update_badges(self) -> None:
         """Add all our badges to the list."""
-        self._badges = donor_drive_comms.get_badges(self.badge_url)
-        
+        self._badges = donor_drive_comms.get_badges(self.badge_url, self._badges_by_code)
+
     def _update_activities(self) -> None:
         """Add activities to the list"""
-        self._activity_list = donor_drive_comms.get_activities(self._activity_url)
+        self._activity_list = donor_drive_comms.get_activities(self.activity_url)
 
     def team_run(self) -> None:
         """A public method to update and output team and team participant info."""
         number_of_donations = self.num_donations
         self.team_api_info()
         if self.num_donations > number_of_donations:
-            self.participant_run()
-            self.donation_run()
+            donor_drive_comms.run_concurrently(self.participant_run, self.donation_run, self._update_activities)
 
     def team_api_info(self) -> None:
-        """Get team info from api."""
+        """Get team info from api.
+
+        The badges are only refreshed if the team JSON changed.
+        """
         self._team_goal, self._team_captain, self._total_raised, self._num_donations,\
-            self._team_avatar_image = self._get_team_json()
+            self.team_avatar_image, changed = self._get_team_json()
         self._update_team_dictionary()
-        self._update_badges()
+        if changed:
+            self._update_badges()
 
     def participant_run(self) -> None:  # pragma: no cover
         """Get and calculate team participant info."""
-        self._participant_list = self._get_participants(top5=False)
-        self._top_5_participant_list = self._get_participants(top5=True)
+        self._participant_list = self._get_participants()
+        # one request for the participants; the top 5 are picked locally instead of asking the api to sort them
+        self._top_5_participant_list = heapq.nlargest(5, self._participant_list, key=donor_drive_comms.by_amount)
         self._participant_calculations()
 
     def donation_run(self) -> None:  # pragma: no cover
-        """Get and calculate donation information."""
-        self._donation_list = donor_drive_comms.get_donations(self._donation_list,
-                                                                                      self.team_donation_url)
+        """Get and calculate donation information.
+
+        The output is only formatted again if the donation list changed.
+        """
+        self._donation_list = donor_drive_comms.get_donations(self._donation_list, self.team_donation_url)
         if self._donation_list:
+            # the list is newest first, so a new donation changes the length and the first donation ID
+            donation_fingerprint = (len(self._donation_list), self._donation_list[0].donation_id)
+            if donation_fingerprint == self._last_donation_fingerprint:
+                return
+            self._last_donation_fingerprint = donation_fingerprint
             self._donation_formatted_output = donor_drive_comms.format_information_for_output(
                 self._donation_list, self.currency_symbol, self.donors_to_display, team=True)
-            team_avatar_for_html = "<img src=" + self.team_avatar_image + ">"
 
     def __str__(self):
         team_info = ""
@@ -251,8 +264,10 @@ class Team:
 
 
 if __name__ == "__main__":  # pragma no cover
+    from rich.logging import RichHandler
+    logging.basicConfig(format="%(message)s", handlers=[RichHandler()])
     # debug next line
     folder = "/home/ermesa/Programming Projects/python/extralife/testOutput"
-    my_team = Team("44013", folder, "$", "5")
+    my_team = Team("44013", folder, "$", "5", "https://www.extra-life.org/api")
     my_team.team_api_info()
     my_team.participant_run()
@@ -1,7 +1,12 @@
 """A Teamgorup is a group of teams, naturally."""
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-@dataclass
+from donordrivepython.api import comms as donor_drive_comms
+from donordrivepython.api.team import Team
+
+
+@dataclass(slots=True, frozen=True)
 class TeamGroup:
     fundraising_goal: float
     group_code: str
@@ -13,12 +18,24 @@ class TeamGroup:
 
 
 def create_team_group(json_data) -> TeamGroup:
-    fundraising_goal: float = json_data.get('fundraisingGoal')
-    group_code: str = json_data.get('groupCode')
-    name: str = json_data.get('name')
-    number_of_donations: int = json_data.get('numDonations')
-    number_of_participants: int = json_data.get('numParticipants')
-    number_of_teams: int = json_data.get('numTeams')
-    sum_of_donations: float = json_data.get('sumDonations')
-    return TeamGroup(fundraising_goal, group_code, name, number_of_donations, number_of_participants, number_of_teams,
-                     sum_of_donations)
+    return TeamGroup(fundraising_goal=json_data.get('fundraisingGoal'),
+                     group_code=json_data.get('groupCode'),
+                     name=json_data.get('name'),
+                     number_of_donations=json_data.get('numDonations'),
+                     number_of_participants=json_data.get('numParticipants'),
+                     number_of_teams=json_data.get('numTeams'),
+                     sum_of_donations=json_data.get('sumDonations'))
+
+
+def run_all(teams: list[Team]) -> None:
+    """Run team_run for each team in a group concurrently.
+
+    Each team_run is mostly waiting on the api, so running them on threads takes about as long as the slowest team.
+    The teams get their own short-lived pool because team_run waits on updates run on the shared executor.
+
+    :param teams: The teams to update.
+    """
+    if not teams:
+        return
+    with ThreadPoolExecutor(max_workers=min(donor_drive_comms.MAX_CONCURRENT_REQUESTS, len(teams))) as executor:
+        donor_drive_comms.run_concurrently(*[a_team.team_run for a_team in teams], executor=executor)
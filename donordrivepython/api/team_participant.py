@@ -15,6 +15,8 @@ class TeamParticipant(donor.Donor):
     :param self.image_url: the url of the participant's avatar image (not used)
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return f"A Team Participant named {self.name} who has donated ${self.amount:.2f} to the team over" \
                f" {self.number_of_donations} donations."
@@ -0,0 +1,37 @@
+"""Shared fixtures for the api tests."""
+
+import json
+from typing import Any, Optional
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def base_api_url() -> str:
+    """The api URL participants and teams are created with."""
+    return "https://www.extra-life.org/api"
+
+
+@pytest.fixture
+def fake_api():
+    """Replace the api session with a fake server.
+
+    Returns a function that sets what the server answers with: a JSON payload that has an ETag and is unchanged (304)
+    if a request sends that ETag back. Endpoints whose URL contains one of the other_endpoints keys get that JSON
+    instead, without an ETag. The function returns the mocked session so a test can check the requests made.
+    """
+    with mock.patch("donordrivepython.api.comms._session") as session:
+        def serve(payload: Any, etag: str = '"v1"', other_endpoints: Optional[dict[str, Any]] = None) -> mock.Mock:
+            def respond(url, headers, timeout):
+                for url_part, endpoint_payload in (other_endpoints or {}).items():
+                    if url_part in url:
+                        return mock.Mock(status_code=200, headers={}, content=json.dumps(endpoint_payload).encode())
+                if headers.get("If-None-Match") == etag:
+                    return mock.Mock(status_code=304, headers={}, content=b"")
+                return mock.Mock(status_code=200, headers={"ETag": etag}, content=json.dumps(payload).encode())
+
+            session.get.side_effect = respond
+            return session
+
+        yield serve
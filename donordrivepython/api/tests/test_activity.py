@@ -0,0 +1,44 @@
+"""Unit tests for activity.py."""
+
+from datetime import datetime, timezone
+from unittest import mock
+
+from donordrivepython.api import activity
+
+CREATED_DATE = "2021-05-23T00:19:14.707+0000"
+
+
+def test_create_donation_activity():
+    """Donation activities become DonationActivity objects."""
+    an_activity = activity.create_activity({"createdDateUTC": CREATED_DATE, "imageURL": "", "amount": 5.0,
+                                            "isIncentive": False, "message": "Go!", "title": "Donor",
+                                            "type": "donation"})
+    assert type(an_activity) is activity.DonationActivity
+    assert an_activity.amount == 5.0
+
+
+def test_create_badge_activity():
+    """Participant and team badge activities become BadgeActivity objects."""
+    for badge_type in ("participantBadge", "teamBadge"):
+        an_activity = activity.create_activity({"createdDateUTC": CREATED_DATE, "imageURL": "",
+                                                "message": "Unlocked", "title": "100 Club", "type": badge_type})
+        assert type(an_activity) is activity.BadgeActivity
+        assert an_activity.title == "100 Club"
+
+
+def test_create_other_activity():
+    """Any other activity type becomes a plain Activity."""
+    an_activity = activity.create_activity({"createdDateUTC": CREATED_DATE, "imageURL": "", "type": "goalReached"})
+    assert type(an_activity) is activity.Activity
+    assert an_activity.type == "goalReached"
+
+
+
+def test_parse_utc_date_two_fractional_digits():
+    """Dates with a fraction fromisoformat can't read on Python 3.10 are still parsed."""
+    expected = datetime(2021, 1, 3, 21, 45, 29, 520000, tzinfo=timezone.utc)
+    assert activity.parse_utc_date("2021-01-03T21:45:29.52+0000") == expected
+    with mock.patch("donordrivepython.api.activity.datetime", wraps=datetime) as python_310_datetime:
+        python_310_datetime.fromisoformat.side_effect = ValueError("Invalid isoformat string")
+        assert activity.parse_utc_date("2021-01-03T21:45:29.52+0000") == expected
+        python_310_datetime.strptime.assert_called_once()
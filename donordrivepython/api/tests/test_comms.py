@@ -0,0 +1,63 @@
+"""Unit tests for comms.py."""
+
+from unittest import mock
+
+from donordrivepython.api import comms as donor_drive_comms
+
+BADGES_JSON = [{"description": "Raised 100 dollars!", "title": "100 Club Badge", "badgeCode": "100-club-badge",
+                "unlockedDateUTC": "2019-10-30T18:01:23.430+0000", "badgeImageURL": "https://example.org/100.png"},
+               {"description": "Custom badge one", "title": "One", "unlockedDateUTC": "2019-10-30T18:01:23.430+0000",
+                "badgeImageURL": "https://example.org/one.png"},
+               {"description": "Custom badge two", "title": "Two", "unlockedDateUTC": "2019-10-30T18:01:23.430+0000",
+                "badgeImageURL": "https://example.org/two.png"}]
+
+
+@mock.patch.dict(donor_drive_comms._response_cache, clear=True)
+def test_get_json_not_modified_returns_cached_json(fake_api):
+    """The second request is conditional and a 304 gives back the JSON of the first response."""
+    session = fake_api(BADGES_JSON)
+    first_json = donor_drive_comms.get_json("https://example.org/badges")
+    second_json = donor_drive_comms.get_json("https://example.org/badges")
+    assert "If-None-Match" not in session.get.call_args_list[0].kwargs["headers"]
+    assert session.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert second_json is first_json
+
+
+@mock.patch.dict(donor_drive_comms._response_cache, clear=True)
+def test_get_json_without_validators_not_cached():
+    """A response without an ETag or Last-Modified header doesn't make the next request conditional."""
+    with mock.patch("donordrivepython.api.comms._session") as session:
+        session.get.return_value = mock.Mock(status_code=200, headers={}, content=b"[]")
+        donor_drive_comms.get_json("https://example.org/badges")
+        donor_drive_comms.get_json("https://example.org/badges")
+    assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+    assert not donor_drive_comms._response_cache
+
+
+@mock.patch.dict(donor_drive_comms._response_cache, clear=True)
+def test_get_json_with_validators(fake_api):
+    """The caller's validators are used instead of the shared cache and NOT_MODIFIED is returned on a 304."""
+    validators: dict = {}
+    fake_api(BADGES_JSON)
+    donor_drive_comms.get_json("https://example.org/badges")
+    assert donor_drive_comms.get_json("https://example.org/badges", validators=validators) == BADGES_JSON
+    assert validators == {"If-None-Match": '"v1"'}
+    assert donor_drive_comms.get_json("https://example.org/badges",
+                                      validators=validators) is donor_drive_comms.NOT_MODIFIED
+
+
+def test_get_badges_reuses_known_badges():
+    """Badges with a badge code are created once and reused on the next call."""
+    known_badges: dict = {}
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=BADGES_JSON):
+        first_badges = donor_drive_comms.get_badges("https://example.org/badges", known_badges)
+        second_badges = donor_drive_comms.get_badges("https://example.org/badges", known_badges)
+    assert second_badges[0] is first_badges[0]
+    assert list(known_badges) == ["100-club-badge"]
+
+
+def test_get_badges_without_badge_code():
+    """Badges without a badge code are each created from their own JSON."""
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=BADGES_JSON):
+        badges = donor_drive_comms.get_badges("https://example.org/badges", {})
+    assert [a_badge.title for a_badge in badges] == ["100 Club Badge", "One", "Two"]
@@ -147,12 +147,18 @@ def test_new_donation_property():
 def test_get_participant_info():
     """Make sure the api info for the participant is properly assigned."""
     my_participant = Participant(fake_participant_conf)
-    assert my_participant._get_participant_info() == (75.0, 2, 600, "//assets.donordrive.com/extralife/images/$avatars$/constituent_D4DC394A-C293-34EB-4162ECD2B8BF4C17.jpg",
-                                                      'Extra Life 2021', 'https://www.extra-life.org/index.cfm?fuseaction=donorDrive.participant&participantID=449263#donate',
-                                                      'https://player.twitch.tv/?channel=djotaku',
-                                                      'https://www.extra-life.org/index.cfm?fuseaction=donorDrive.participant&participantID=449263',
-                                                      '2021-01-03T21:45:29.523+0000', False, 0, 'Twitchclub', False,
-                                                      'Eric Mesa')
+    my_participant._get_participant_info()
+    assert (my_participant.total_raised, my_participant.number_of_donations, my_participant.goal,
+            my_participant.avatar_image_url, my_participant.event_name, my_participant.donation_link_url,
+            my_participant.stream_url, my_participant.extra_life_page_url, my_participant.created_date_utc,
+            my_participant.stream_is_live, my_participant.sum_pledges, my_participant.team_name,
+            my_participant.is_team_captain, my_participant.display_name) == \
+        (75.0, 2, 600, "//assets.donordrive.com/extralife/images/$avatars$/constituent_D4DC394A-C293-34EB-4162ECD2B8BF4C17.jpg",
+         'Extra Life 2021', 'https://www.extra-life.org/index.cfm?fuseaction=donorDrive.participant&participantID=449263#donate',
+         'https://player.twitch.tv/?channel=djotaku',
+         'https://www.extra-life.org/index.cfm?fuseaction=donorDrive.participant&participantID=449263',
+         '2021-01-03T21:45:29.523+0000', False, 0, 'Twitchclub', False,
+         'Eric Mesa')
 
 
 @mock.patch.object(eldonationtracker.utils.donor_drive_comms, "get_json", fake_extralife_io.get_json_no_team)
@@ -160,19 +166,31 @@ def test_get_participant_info_no_team():
     """Make sure the api info for the participant is properly assigned."""
     my_participant = Participant(fake_participant_conf)
     my_participant._my_team = None
-    assert my_participant._get_participant_info() == (75.0, 2, 600, "//assets.donordrive.com/extralife/images/$avatars$/constituent_D4DC394A-C293-34EB-4162ECD2B8BF4C17.jpg",
-                                                      'Extra Life 2021', 'https://www.extra-life.org/index.cfm?fuseaction=donorDrive.participant&participantID=449263#donate',
-                                                      'https://player.twitch.tv/?channel=djotaku',
-                                                      'https://www.extra-life.org/index.cfm?fuseaction=donorDrive.participant&participantID=449263',
-                                                      '2021-01-03T21:45:29.523+0000', False, 0, '', False,
-                                                      'Eric Mesa')
+    my_participant._get_participant_info()
+    assert (my_participant.total_raised, my_participant.number_of_donations, my_participant.goal,
+            my_participant.avatar_image_url, my_participant.event_name, my_participant.donation_link_url,
+            my_participant.stream_url, my_participant.extra_life_page_url, my_participant.created_date_utc,
+            my_participant.stream_is_live, my_participant.sum_pledges, my_participant.team_name,
+            my_participant.is_team_captain, my_participant.display_name) == \
+        (75.0, 2, 600, "//assets.donordrive.com/extralife/images/$avatars$/constituent_D4DC394A-C293-34EB-4162ECD2B8BF4C17.jpg",
+         'Extra Life 2021', 'https://www.extra-life.org/index.cfm?fuseaction=donorDrive.participant&participantID=449263#donate',
+         'https://player.twitch.tv/?channel=djotaku',
+         'https://www.extra-life.org/index.cfm?fuseaction=donorDrive.participant&participantID=449263',
+         '2021-01-03T21:45:29.523+0000', False, 0, '', False,
+         'Eric Mesa')
 
 
 @mock.patch.object(eldonationtracker.utils.donor_drive_comms, "get_json", fake_extralife_io.get_JSON_no_json)
 def test_get_participant_info_no_json():
     """Ensure that the proper values are returned if the JSON values are not retrieved from the api."""
     my_participant = Participant(fake_participant_conf)
-    assert my_participant._get_participant_info() == (0, 0, 0, '', '', '', '', '', '', False, 0, '', False, '')
+    my_participant._get_participant_info()
+    assert (my_participant.total_raised, my_participant.number_of_donations, my_participant.goal,
+            my_participant.avatar_image_url, my_participant.event_name, my_participant.donation_link_url,
+            my_participant.stream_url, my_participant.extra_life_page_url, my_participant.created_date_utc,
+            my_participant.stream_is_live, my_participant.sum_pledges, my_participant.team_name,
+            my_participant.is_team_captain, my_participant.display_name) == \
+        (0, 0, 0, '', '', '', '', '', '', False, 0, '', False, '')
 
 
 def test_format_participant_info_for_output():
@@ -0,0 +1,195 @@
+"""Unit tests for how participant.py refreshes its data from the api."""
+
+from unittest import mock
+
+import pytest
+
+from donordrivepython.api import participant as participant
+
+ACTIVITY_JSON = [{"createdDateUTC": "2021-05-23T00:19:14.707+0000", "imageURL": "https://example.org/image.png",
+                  "message": "Go team!", "title": "Donor", "type": "donation", "amount": 5.0, "isIncentive": False}]
+PARTICIPANT_JSON = {"displayName": "Eric Mesa", "fundraisingGoal": 600, "eventName": "Extra Life 2021",
+                    "links": {"donate": "https://example.org/donate", "page": "https://example.org/page",
+                              "stream": "https://player.twitch.tv/?channel=djotaku"},
+                    "createdDateUTC": "2021-01-03T21:45:29.523+0000", "sumDonations": 75.0, "numDonations": 2,
+                    "avatarImageURL": "//example.org/avatar.jpg", "streamIsLive": False, "sumPledges": 0,
+                    "teamName": "Twitchclub", "isTeamCaptain": True}
+
+
+def make_participant(base_api_url: str) -> participant.Participant:
+    return participant.Participant("12345", "folder", "$", "", "5", base_api_url)
+
+
+def participant_info(a_participant: participant.Participant) -> tuple:
+    return (a_participant.total_raised, a_participant.number_of_donations, a_participant.goal,
+            a_participant.avatar_image_url, a_participant.event_name, a_participant.donation_link_url,
+            a_participant.stream_url, a_participant.extra_life_page_url, a_participant.created_date_utc,
+            a_participant.stream_is_live, a_participant.sum_pledges, a_participant.team_name,
+            a_participant.is_team_captain, a_participant.display_name)
+
+
+def test_update_activities_not_modified(fake_api, base_api_url):
+    """A 304 keeps the activities from the earlier response."""
+    session = fake_api(ACTIVITY_JSON)
+    my_participant = make_participant(base_api_url)
+    my_participant._update_activities()
+    activities = my_participant.activities
+    my_participant._update_activities()
+    assert session.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert my_participant.activities is activities
+    assert len(activities) == 1
+
+
+def test_new_participant_first_request_not_conditional(fake_api, base_api_url):
+    """A Participant for an id another Participant already fetched still gets its activities."""
+    session = fake_api(ACTIVITY_JSON)
+    make_participant(base_api_url)._update_activities()
+    session.get.reset_mock()
+    my_participant = make_participant(base_api_url)
+    my_participant._update_activities()
+    assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+    assert len(my_participant.activities) == 1
+
+
+def test_update_activities_retried_after_failure(fake_api, base_api_url):
+    """If the JSON couldn't be processed, the next request isn't conditional so it is processed again."""
+    session = fake_api(ACTIVITY_JSON)
+    my_participant = make_participant(base_api_url)
+    with mock.patch("donordrivepython.api.activity.create_activity", side_effect=ValueError):
+        with pytest.raises(ValueError):
+            my_participant._update_activities()
+    my_participant._update_activities()
+    assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+    assert len(my_participant.activities) == 1
+
+
+def test_update_donation_data_page_longer_than_kept(base_api_url):
+    """Donations trimmed off the end of the list don't come back as new ones on the next poll."""
+    donations_json = [{"displayName": f"Donor {number}", "amount": number, "donationID": str(number)}
+                      for number in range(60, 0, -1)]
+    my_participant = make_participant(base_api_url)
+    my_participant._number_of_donations = 60
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=donations_json):
+        my_participant.update_donation_data()
+        my_participant.update_donation_data()
+    donation_ids = [a_donation.donation_id for a_donation in my_participant._donation_list]
+    assert donation_ids == [str(number) for number in range(60, 10, -1)]
+    new_donation_json = [{"displayName": "Donor 61", "amount": 61, "donationID": "61"}] + donations_json
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=new_donation_json):
+        my_participant.update_donation_data()
+    donation_ids = [a_donation.donation_id for a_donation in my_participant._donation_list]
+    assert donation_ids == [str(number) for number in range(61, 11, -1)]
+    assert my_participant._top_donation.donation_id == "61"
+
+
+def test_update_donor_data_page_longer_than_kept(base_api_url):
+    """Donors trimmed off the end of the list don't come back on the next poll."""
+    donors_json = [{"displayName": f"Donor {number}", "sumDonations": number, "donorID": str(number),
+                    "numDonations": 1} for number in range(60, 0, -1)]
+    my_participant = make_participant(base_api_url)
+    my_participant._number_of_donations = 60
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=donors_json):
+        my_participant.update_donor_data()
+        my_participant.update_donor_data()
+    donor_ids = [a_donor.donor_id for a_donor in my_participant._donor_list]
+    assert donor_ids == [str(number) for number in range(60, 10, -1)]
+
+
+def test_update_donation_data_largest_past_kept(base_api_url):
+    """The top donation is found before the list is trimmed, even if it's past the donations that are kept."""
+    first_json = [{"displayName": "Donor 1", "amount": 1, "donationID": "1"}]
+    donations_json = [{"displayName": f"Donor {number}", "amount": number, "donationID": str(number)}
+                      for number in range(160, 100, -1)]
+    donations_json[55]["amount"] = 1000
+    my_participant = make_participant(base_api_url)
+    my_participant._number_of_donations = 1
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=first_json):
+        my_participant.update_donation_data()
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=donations_json + first_json):
+        my_participant.update_donation_data()
+    assert len(my_participant._donation_list) == 50
+    assert my_participant._top_donation.amount == 1000
+
+
+def test_update_donor_data_largest_past_kept(base_api_url):
+    """The top donor is found before the list is trimmed, even if it's past the donors that are kept."""
+    donors_json = [{"displayName": f"Donor {number}", "sumDonations": number, "donorID": str(number),
+                    "numDonations": 1} for number in range(60, 0, -1)]
+    donors_json[55]["sumDonations"] = 1000
+    my_participant = make_participant(base_api_url)
+    my_participant._number_of_donations = 60
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=donors_json):
+        my_participant.update_donor_data()
+    assert len(my_participant._donor_list) == 50
+    assert my_participant._top_donor.amount == 1000
+
+
+def test_participant_without_donors_to_display(base_api_url):
+    """A missing donors_to_display setting doesn't stop the Participant from being created."""
+    my_participant = participant.Participant("12345", "folder", "$", "", None, base_api_url)
+    assert my_participant.donors_to_display is None
+
+
+def test_top_donation_and_donor_from_api_ordering(base_api_url):
+    """On the first poll the top donation and donor come from the api's ordering by amount.
+
+    The largest ones are older than the newest page, so they aren't in the donation or donor lists.
+    """
+    donations_json = [{"displayName": f"Donor {number}", "amount": number, "donationID": str(number)}
+                      for number in range(60, 0, -1)]
+    donors_json = [{"displayName": f"Donor {number}", "sumDonations": number, "donorID": str(number),
+                    "numDonations": 1} for number in range(60, 0, -1)]
+    top_donation_json = [{"displayName": "Big Donor", "amount": 1000, "donationID": "big"}]
+    top_donor_json = [{"displayName": "Big Donor", "sumDonations": 1000, "donorID": "big", "numDonations": 1}]
+
+    def fake_get_json(url, order_by_donations=False, order_by_amount=False):
+        if url.endswith("/donors"):
+            return top_donor_json if order_by_donations else donors_json
+        return top_donation_json if order_by_amount else donations_json
+
+    my_participant = make_participant(base_api_url)
+    my_participant._number_of_donations = 100
+    with mock.patch("donordrivepython.api.comms.get_json", side_effect=fake_get_json):
+        my_participant.update_donation_data()
+        my_participant.update_donor_data()
+    assert my_participant._top_donation.donation_id == "big"
+    assert my_participant._top_donor.donor_id == "big"
+
+
+def test_participant_without_currency_symbol(base_api_url):
+    """A missing currency symbol formats amounts without one."""
+    my_participant = participant.Participant("12345", "folder", None, "", "5", base_api_url)
+    assert my_participant._format_participant_info_for_output(1234.5) == "1,234.50"
+
+
+def test_get_participant_info(base_api_url):
+    """The api info for the participant is assigned to its attributes."""
+    my_participant = participant.Participant("12345", "folder", "$", "54321", "5", base_api_url)
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=PARTICIPANT_JSON):
+        my_participant._get_participant_info()
+    assert participant_info(my_participant) == \
+        (75.0, 2, 600, "//example.org/avatar.jpg", "Extra Life 2021", "https://example.org/donate",
+         "https://player.twitch.tv/?channel=djotaku", "https://example.org/page", "2021-01-03T21:45:29.523+0000",
+         False, 0, "Twitchclub", True, "Eric Mesa")
+
+
+def test_get_participant_info_no_team(base_api_url):
+    """Without a team the team name and captain status are left empty."""
+    my_participant = make_participant(base_api_url)
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=PARTICIPANT_JSON):
+        my_participant._get_participant_info()
+    assert my_participant.team_name == ""
+    assert my_participant.is_team_captain is False
+    assert my_participant.display_name == "Eric Mesa"
+
+
+def test_get_participant_info_no_json(base_api_url):
+    """If the api can't be reached, the attributes keep their current values."""
+    my_participant = make_participant(base_api_url)
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=PARTICIPANT_JSON):
+        my_participant._get_participant_info()
+    with mock.patch("donordrivepython.api.comms.get_json", return_value={}):
+        my_participant._get_participant_info()
+    assert my_participant.total_raised == 75.0
+    assert my_participant.number_of_donations == 2
+    assert my_participant.display_name == "Eric Mesa"
@@ -33,7 +33,8 @@ def test_get_team_json():
                                   "avatarImageURL": "//assets.donordrive.com/…avatar-team-default.gif"}):
         my_team = team.Team("12345", "folder", "$", "5")
         team_json = my_team._get_team_json()
-        assert team_json == (500, 'Captain Awesome', 400, 300, "//assets.donordrive.com/…avatar-team-default.gif")
+        assert team_json == (500, 'Captain Awesome', 400, 300, "//assets.donordrive.com/…avatar-team-default.gif",
+                             True)
 
 
 def test_get_team_json_no_json():
@@ -41,16 +42,17 @@ def test_get_team_json_no_json():
     with mock.patch("eldonationtracker.api.team.extralife_io.get_json", return_value={}):
         my_team = team.Team("12345", "folder", "$", "5")
         team_json = my_team._get_team_json()
-        assert team_json == (0, '', 0, 0, '')
+        assert team_json == (0, '', 0, 0, '', False)
         # let's pretend that at some point values were added
         # but now the api can't be reached. Let's make sure it doesn't over-write the good data.
         my_team._team_goal = 500
         my_team._team_captain = 'Captain Awesome'
         my_team._total_raised = 400
         my_team._num_donations = 300
-        my_team._team_avatar_image = "//assets.donordrive.com/…avatar-team-default.gif"
+        my_team.team_avatar_image = "//assets.donordrive.com/…avatar-team-default.gif"
         team_json = my_team._get_team_json()
-        assert team_json == (500, 'Captain Awesome', 400, 300, "//assets.donordrive.com/…avatar-team-default.gif")
+        assert team_json == (500, 'Captain Awesome', 400, 300, "//assets.donordrive.com/…avatar-team-default.gif",
+                             False)
 
 
 def test_update_team_dictionary():
@@ -66,7 +68,7 @@ def test_update_team_dictionary():
 def test_get_participants_no_participants():
     my_team = team.Team("12345", "folder", "$", "5")
     with mock.patch("eldonationtracker.api.team.extralife_io.get_json", return_value={}):
-        participants = my_team._get_participants(False)
+        participants = my_team._get_participants()
         assert participants == []
         assert my_team._participant_list == []
 
@@ -99,25 +101,22 @@ def test_get_participants():
                           "avatarImageURL":"//assets.donordrive.com/extralife/images/$avatars$/constituent_0AFEA929-C29F-F29A-6B659B3718802B75.jpg",
                           "teamID":50394,"isTeamCaptain":False,"sumPledges":0.00,"numDonations":1}]
     with mock.patch("eldonationtracker.api.team.extralife_io.get_json", return_value=team_participants):
-        participants = my_team._get_participants(False)
+        participants = my_team._get_participants()
         assert participants[0].name == "Karl Abraham"
         assert participants[1].name == "Ben Tolmachoff"
 
 
-def test_get_participants_no_participants_top_5():
+def test_participant_run_no_participants_top_5():
     my_team = team.Team("12345", "folder", "$", "5")
     with mock.patch("eldonationtracker.api.team.extralife_io.get_json", return_value={}):
-        participants = my_team._get_participants(True)
-        assert participants == []
+        my_team.participant_run()
         assert my_team._top_5_participant_list == []
 
 
-def test_get_participants_top_5():
+def test_participant_run_top_5():
     """Test getting top 5 participants.
 
-    While, of course, in reality the JSON would be different - sorted by donations, in terms
-    of what the code has to do with what it gets back, there is no difference. So I have just copied things
-    to ensure I'm considering both parts of the if statement in this function.
+    The participants come back from the api unsorted, so the top 5 are picked by amount locally.
     """
     my_team = team.Team("12345", "folder", "$", "5")
     team_participants = [{"displayName":"Karl Abraham",
@@ -146,9 +145,9 @@ def test_get_participants_top_5():
                           "avatarImageURL":"//assets.donordrive.com/extralife/images/$avatars$/constituent_0AFEA929-C29F-F29A-6B659B3718802B75.jpg",
                           "teamID":50394,"isTeamCaptain":False,"sumPledges":0.00,"numDonations":1}]
     with mock.patch("eldonationtracker.api.team.extralife_io.get_json", return_value=team_participants):
-        participants = my_team._get_participants(True)
-        assert participants[0].name == "Karl Abraham"
-        assert participants[1].name == "Ben Tolmachoff"
+        my_team.participant_run()
+        assert my_team._top_5_participant_list[0].name == "Michael Bataligin"
+        assert len(my_team._top_5_participant_list) == 3
 
 
 def test_top_participant_no_participants():
@@ -185,7 +184,7 @@ def test_top_participant():
                           "avatarImageURL":"//assets.donordrive.com/extralife/images/$avatars$/constituent_0AFEA929-C29F-F29A-6B659B3718802B75.jpg",
                           "teamID":50394,"isTeamCaptain":False,"sumPledges":0.00,"numDonations":1}]
     with mock.patch("eldonationtracker.api.team.extralife_io.get_json", return_value=team_participants):
-        my_team._top_5_participant_list = my_team._get_participants(True)
+        my_team._top_5_participant_list = my_team._get_participants()
         top_participant = my_team._top_participant()
         assert top_participant == "Karl Abraham - $0.00"
 
@@ -227,7 +226,7 @@ def test_participant_calculations():
                           "avatarImageURL":"//assets.donordrive.com/extralife/images/$avatars$/constituent_0AFEA929-C29F-F29A-6B659B3718802B75.jpg",
                           "teamID":50394,"isTeamCaptain":False,"sumPledges":0.00,"numDonations":1}]
     with mock.patch("eldonationtracker.api.team.extralife_io.get_json", return_value=team_participants):
-        my_team._top_5_participant_list = my_team._get_participants(True)
+        my_team._top_5_participant_list = my_team._get_participants()
         my_team._participant_calculations()
         assert my_team._participant_calculation_dict['Team_TopParticipantNameAmnt'] == "Karl Abraham - $0.00"
         assert my_team._participant_calculation_dict['Team_Top5ParticipantsHorizontal'] == "Karl Abraham - $0.00 | Ben Tolmachoff - $0.00 | Michael Bataligin - $5.00 | "
@@ -235,7 +234,7 @@ def test_participant_calculations():
 
 
 fake_get_team_json = mock.Mock()
-fake_get_team_json.return_value = 400, "Captain", 401, 3, "//assets.donordrive.com/…avatar-team-default.gif"
+fake_get_team_json.return_value = 400, "Captain", 401, 3, "//assets.donordrive.com/…avatar-team-default.gif", True
 fake_participant_run = mock.Mock()
 fake_write_text_files = mock.Mock()
 fake_donation_run = mock.Mock()
@@ -252,13 +251,14 @@ def test_team_run():
     assert fake_participant_run.call_count == 1
     my_team.team_run()
     assert fake_participant_run.call_count == 1
-    fake_get_team_json.return_value = 400, "Captain", 402, 4, "//assets.donordrive.com/…avatar-team-default.gif"
+    fake_get_team_json.return_value = 400, "Captain", 402, 4, "//assets.donordrive.com/…avatar-team-default.gif", \
+        True
     my_team.team_run()
     assert fake_participant_run.call_count == 2
 
 
 fake_get_team_json2 = mock.Mock()
-fake_get_team_json2.return_value = 400, "Captain", 401, 3, "//assets.donordrive.com/…avatar-team-default.gif"
+fake_get_team_json2.return_value = 400, "Captain", 401, 3, "//assets.donordrive.com/…avatar-team-default.gif", True
 fake_output_badge_data = mock.Mock()
 
 
@@ -279,6 +279,7 @@ def test_team_api_info():
     assert my_team._team_info["Team_captain"] == "Captain"
     assert my_team._team_info["Team_totalRaised"] == "$401.00"
     assert my_team._team_info["Team_numDonations"] == '3'
+    assert fake_badge_run.call_count == 1
 
 
 def test_str_no_json_data():
@@ -0,0 +1,98 @@
+"""Unit tests for how team.py refreshes its data from the api."""
+
+import subprocess
+import sys
+from unittest import mock
+
+from donordrivepython.api import team as team
+
+TEAM_JSON = {"fundraisingGoal": 500, "captainDisplayName": "Captain Awesome", "sumDonations": 400,
+             "numDonations": 3, "avatarImageURL": "//assets.donordrive.com/…avatar-team-default.gif"}
+
+
+def test_team_api_info_unchanged(base_api_url):
+    """Badges should not be refreshed if the team JSON didn't change."""
+    unchanged_team_json = mock.Mock()
+    unchanged_team_json.return_value = 400, "Captain", 401, 3, "//assets.donordrive.com/…avatar-team-default.gif", \
+        False
+    badge_run = mock.Mock()
+    with mock.patch.object(team.Team, "_get_team_json", unchanged_team_json), \
+            mock.patch.object(team.Team, "_update_badges", badge_run):
+        my_team = team.Team("12345", "folder", "$", "5", base_api_url)
+        my_team.team_api_info()
+        assert my_team.total_raised == 401
+        badge_run.assert_not_called()
+
+
+def test_team_api_info_not_modified(fake_api, base_api_url):
+    """A 304 for the team JSON keeps the team values and doesn't refresh the badges."""
+    session = fake_api(TEAM_JSON, '"team-v1"', {"/badges": []})
+    my_team = team.Team("12345", "folder", "$", "5", base_api_url)
+    my_team.team_api_info()
+    my_team.team_api_info()
+    assert my_team.total_raised == 400
+    assert my_team.num_donations == 3
+    badge_requests = [a_call for a_call in session.get.call_args_list if "/badges" in a_call.kwargs["url"]]
+    assert len(badge_requests) == 1
+
+
+def test_new_team_first_request_not_conditional(fake_api, base_api_url):
+    """A Team made for a team id that another Team already fetched still gets the team JSON and badges."""
+    session = fake_api(TEAM_JSON, '"team-v1"', {"/badges": []})
+    team.Team("12345", "folder", "$", "5", base_api_url).team_api_info()
+    session.get.reset_mock()
+    my_team = team.Team("12345", "folder", "$", "5", base_api_url)
+    my_team.team_api_info()
+    assert "If-None-Match" not in session.get.call_args_list[0].kwargs["headers"]
+    assert my_team.total_raised == 400
+    assert my_team.team_captain == "Captain Awesome"
+    assert any("/badges" in a_call.kwargs["url"] for a_call in session.get.call_args_list)
+
+
+def test_donation_run_unchanged(base_api_url):
+    """The donation output is only formatted again when a new donation arrives."""
+    donations_json = [{"displayName": "Donor 2", "amount": 10, "donationID": "2"},
+                      {"displayName": "Donor 1", "amount": 5, "donationID": "1"}]
+    my_team = team.Team("12345", "folder", "$", "5", base_api_url)
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=donations_json), \
+            mock.patch("donordrivepython.api.comms.format_information_for_output",
+                       return_value={"Team_LastDonationNameAmnt": "Donor 2 - $10.00"}) as format_output:
+        my_team.donation_run()
+        my_team.donation_run()
+        assert format_output.call_count == 1
+        donations_json.insert(0, {"displayName": "Donor 3", "amount": 20, "donationID": "3"})
+        my_team.donation_run()
+        assert format_output.call_count == 2
+
+
+def test_import_without_rich():
+    """Importing the team module doesn't import Rich."""
+    result = subprocess.run([sys.executable, "-c",
+                             "import sys, donordrivepython.api.team; print('rich' in sys.modules)"],
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_update_team_dictionary_currency_symbol_changed(base_api_url):
+    """Changing the currency symbol formats the team info again even if the team values didn't change."""
+    my_team = team.Team("12345", "folder", "$", "5", base_api_url)
+    my_team._total_raised = 400
+    my_team._update_team_dictionary()
+    assert my_team._team_info["Team_totalRaised"] == "$400.00"
+    my_team.currency_symbol = "€"
+    my_team._update_team_dictionary()
+    assert my_team._team_info["Team_totalRaised"] == "€400.00"
+
+
+def test_participant_run_top_5(base_api_url):
+    """The participants come back from the api unsorted, so the top 5 are picked by amount locally."""
+    amounts = {"Karl": 3, "Ben": 50, "Michael": 0, "Anna": 20, "Jeff": 7, "Vinny": 100, "Alex": 1}
+    team_participants = [{"displayName": name, "sumDonations": amount, "numDonations": 1}
+                         for name, amount in amounts.items()]
+    my_team = team.Team("12345", "folder", "$", "5", base_api_url)
+    with mock.patch("donordrivepython.api.comms.get_json", return_value=team_participants):
+        my_team.participant_run()
+    assert len(my_team._participant_list) == 7
+    assert [a_participant.name for a_participant in my_team._top_5_participant_list] == \
+        ["Vinny", "Ben", "Anna", "Jeff", "Karl"]
+    assert my_team._participant_calculation_dict["Team_TopParticipantNameAmnt"] == "Vinny - $100.00"